@@ -1,11 +1,12 @@
 """Implementation of Builder and AsyncBuilder to build using solution."""
 
 import asyncio
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
 from concurrent.futures import ThreadPoolExecutor
-from functools import partial
 from typing import Any, TypeVar
 
-from composify.core import Solution
+from composify.core import Solution, SolutionArg
 from composify.errors import AsyncSolutionError
 
 __all__ = [
@@ -17,17 +18,46 @@ __all__ = [
 T = TypeVar("T")
 
 
+def _call(solution: Solution, names: tuple[str, ...], values: list[Any]) -> Any:
+    # Solutions can be built by hand, so their arguments are only passed
+    # positionally when they match the rule's parameters exactly.
+    if names == solution.positional_parameters:
+        return solution.function(*values)
+    return solution.function(**dict(zip(names, values, strict=True)))
+
+
 class AsyncBuilder:
-    """Build objects from solutions. Supports async solutions."""
+    """Build objects from solutions. Supports async solutions.
+
+    Built objects are cached per solution. Set `maxsize` to keep only the
+    most recently used solutions; in-flight builds are never evicted.
+    """
 
-    _cache: dict[Solution, asyncio.Task[Any]]
+    _cache: OrderedDict[Solution, asyncio.Future[Any]]
 
     def __init__(
         self,
         threadpool_executor: ThreadPoolExecutor | None = None,
+        maxsize: int | None = None,
     ) -> None:
-        self._cache = {}
+        self._cache = OrderedDict()
         self._threadpool_executor = threadpool_executor
+        self._maxsize = maxsize
+
+    def _evict(self) -> None:
+        if self._maxsize is None:
+            return
+        excess = len(self._cache) - self._maxsize
+        if excess <= 0:
+            return
+        evicted = []
+        for solution, task in self._cache.items():
+            if len(evicted) == excess:
+                break
+            if task.done():
+                evicted.append(solution)
+        for solution in evicted:
+            del self._cache[solution]
 
     async def get_cached(self, solution: Solution) -> T | None:
         """Get cached value for a solution.
@@ -39,7 +69,10 @@ class AsyncBuilder:
             T | None: The cached value if it exists; otherwise None.
         """
         cached = self._cache.get(solution, None)
-        return await cached if cached else None
+        if cached is None:
+            return None
+        self._cache.move_to_end(solution)
+        return await cached
 
     async def from_solution(self, solution: Solution) -> T:
         """Build an object using a solution.
@@ -50,58 +83,123 @@ class AsyncBuilder:
         Returns:
             T: A built object.
         """
-        task = self._cache.get(solution, None)
-        if task is not None:
-            return await task
-        task = asyncio.Task(self._from_solution(solution))
+        future = self._cache.get(solution, None)
+        if future is not None:
+            self._cache.move_to_end(solution)
+            return await future
+        return await self._get_future(solution, self._requires_loop(solution))
+
+    def _get_future(
+        self, solution: Solution, requires_loop: dict[Solution, bool]
+    ) -> asyncio.Future[Any]:
+        future = self._cache.get(solution, None)
+        if future is not None:
+            self._cache.move_to_end(solution)
+            return future
+        if self._threadpool_executor is not None or requires_loop[solution]:
+            # We cache the task instead of the result before awaiting anything.
+            # This allows asynchronous requests to share the same task.
+            # ensure_future respects the running loop's task factory.
+            future = self._cache[solution] = asyncio.ensure_future(
+                self._from_solution(solution, requires_loop)
+            )
+        else:
+            self._build_sync(solution)
+            future = self._cache[solution]
+        self._evict()
+        return future
+
+    def _requires_loop(self, root: Solution) -> dict[Solution, bool]:
+        # Decided once per build, for every solution in the graph: a solution
+        # needs the loop if it or any of its dependencies is async. This does
+        # not depend on the cache, so a sync solution never has a pending
+        # future and its subtree can always be built by _build_sync.
+        requires_loop: dict[Solution, bool] = {}
+        if self._threadpool_executor is not None:
+            return requires_loop
+        stack: list[tuple[Solution, Iterator[SolutionArg]]] = [
+            (root, iter(root.args))
+        ]
+        while stack:
+            solution, args = stack[-1]
+            for arg in args:
+                if arg.solution not in requires_loop:
+                    stack.append((arg.solution, iter(arg.solution.args)))
+                    break
+            else:
+                stack.pop()
+                requires_loop[solution] = solution.is_async or any(
+                    requires_loop[arg.solution] for arg in solution.args
+                )
+        return requires_loop
+
+    def _build_sync(self, solution: Solution) -> Any:
+        # Sync subtrees are built without scheduling any task;
+        # their values are cached as already completed futures.
+        cached = self._cache.get(solution, None)
+        if cached is not None:
+            self._cache.move_to_end(solution)
+            return cached.result()
 
-        # We cache the coroutine instead of the result
-        # This allows asynchronous requests to share the same coroutine
-        self._cache[solution] = task
+        names = tuple(arg.name for arg in solution.args)
+        values = [self._build_sync(arg.solution) for arg in solution.args]
+        value = _call(solution, names, values)
 
-        value = await task
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(value)
+        self._cache[solution] = future
 
         return value
 
-    async def _from_solution(self, solution: Solution) -> T:
-        name_task_pairs = tuple(
-            (arg.name, self.from_solution(arg.solution))
-            for arg in solution.args
-        )
-
-        names = tuple(p[0] for p in name_task_pairs)
-        tasks = tuple(p[1] for p in name_task_pairs)
-
-        results = tuple(await asyncio.gather(*tasks))
-
-        parameters = dict(zip(names, results, strict=True))
+    async def _from_solution(
+        self, solution: Solution, requires_loop: dict[Solution, bool]
+    ) -> T:
+        args = solution.args
+        names = tuple(arg.name for arg in args)
+        futures = [
+            self._get_future(arg.solution, requires_loop) for arg in args
+        ]
+
+        # Shared dependencies are often already done; only wait on the rest.
+        # gather fails fast and marks later failures as retrieved.
+        pending = [future for future in futures if not future.done()]
+        if pending:
+            await asyncio.gather(*pending)
+        values = [future.result() for future in futures]
 
-        if asyncio.iscoroutinefunction(solution.function):
-            value = await solution(**parameters)
+        if solution.is_async:
+            value = await _call(solution, names, values)
         elif self._threadpool_executor is not None:
             loop = asyncio.get_running_loop()
             value = await loop.run_in_executor(
-                self._threadpool_executor,
-                partial(solution.function, **parameters),  # type: ignore[arg-type]
+                self._threadpool_executor, _call, solution, names, values
             )
         else:
-            value = solution.function(**parameters)
+            value = _call(solution, names, values)
 
         return value
 
 
 class Builder:
-    """Builder objects from solutions. Does not support async solutions."""
+    """Builder objects from solutions. Does not support async solutions.
+
+    Built objects are cached per solution. Set `maxsize` to keep only the
+    most recently used solutions.
+    """
 
-    _cache: dict[Solution, Any]
+    _cache: OrderedDict[Solution, Any]
 
     def __init__(
         self,
+        maxsize: int | None = None,
     ) -> None:
-        self._cache = {}
+        self._cache = OrderedDict()
+        self._maxsize = maxsize
 
     def from_solution(self, solution: Solution) -> T:
         """Build an object using a solution.
+        Uncached dependencies are ordered first, then built in a single pass,
+        so each distinct solution is visited and built once.
 
         Args:
             solution (Solution): A solution to base on.
@@ -112,25 +210,83 @@ class Builder:
         Returns:
             T: A built object.
         """
-        if solution.is_async:
-            raise AsyncSolutionError(
-                f"Trying to build from async solution {solution}"
-            )
-        value = self._cache.get(solution, None)
-        if value is not None:
-            return value
+        return self.from_solutions((solution,))[0]
 
-        value = self._from_solution(solution)
+    build_all = from_solution
 
-        self._cache[solution] = value
+    def from_solutions(self, solutions: Iterable[Solution]) -> list[T]:
+        """Build objects using multiple solutions at once.
+        Dependencies shared between the solutions are ordered and built once.
 
-        return value
+        Args:
+            solutions (Iterable[Solution]): Solutions to base on.
 
-    def _from_solution(self, solution: Solution) -> T:
-        parameters = {
-            arg.name: self.from_solution(arg.solution) for arg in solution.args
-        }
+        Raises:
+            AsyncSolutionError: If any solution requires async loop.
 
-        value = solution.function(**parameters)
+        Returns:
+            list[T]: Built objects in the same order as the solutions.
+        """
+        roots = tuple(solutions)
+        built: dict[Solution, Any] = {}
+        for solution in self._build_order(roots, built):
+            args = solution.args
+            value = _call(
+                solution,
+                tuple(arg.name for arg in args),
+                [built[arg.solution] for arg in args],
+            )
+            built[solution] = value
+            self._store(solution, value)
+        return [built[root] for root in roots]
 
-        return value
+    def _store(self, solution: Solution, value: Any) -> None:
+        self._cache[solution] = value
+        if self._maxsize is not None and len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+
+    def _build_order(
+        self, roots: tuple[Solution, ...], built: dict[Solution, Any]
+    ) -> list[Solution]:
+        # Post-order walk with an explicit stack instead of recursion.
+        # Cached solutions are copied into `built` so later evictions
+        # cannot drop them before they are used.
+        order: list[Solution] = []
+        visited: set[Solution] = set()
+        stack: list[tuple[Solution, Iterator[SolutionArg]]] = []
+        for root in roots:
+            if not self._visit(root, visited, built):
+                continue
+            stack.append((root, iter(root.args)))
+            while stack:
+                solution, args = stack[-1]
+                for arg in args:
+                    dependency = arg.solution
+                    if self._visit(dependency, visited, built):
+                        stack.append((dependency, iter(dependency.args)))
+                        break
+                else:
+                    stack.pop()
+                    order.append(solution)
+        return order
+
+    def _visit(
+        self,
+        solution: Solution,
+        visited: set[Solution],
+        built: dict[Solution, Any],
+    ) -> bool:
+        # Returns whether the solution still needs to be built.
+        if solution in visited:
+            return False
+        visited.add(solution)
+        if solution.is_async:
+            raise AsyncSolutionError(
+                f"Trying to build from async solution {solution}"
+            )
+        value = self._cache.get(solution, None)
+        if value is not None:
+            self._cache.move_to_end(solution)
+            built[solution] = value
+            return False
+        return True
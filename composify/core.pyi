@@ -53,6 +53,7 @@ class Rule:
     dependencies: Dependencies
     priority: int
     is_async: bool
+    positional_parameters: tuple[str, ...] | None
 
     def __new__(
         function: Callable,
@@ -61,6 +62,7 @@ class Rule:
         dependencies: Mapping[str, type],
         priority: int,
         is_async: bool,
+        positional_parameters: tuple[str, ...] | None = None,
     ): ...
     def __hash__(self): ...
 
@@ -107,6 +109,7 @@ class SolutionArgsCollection(Sequence[SolutionArg]):
     def __new__(self): ...
     @overload
     def __new__(self, args: Mapping[str, Solution]): ...
+    def __len__(self) -> int: ...
     def __hash__(self): ...
 
 class Solution:
@@ -121,6 +124,8 @@ class Solution:
     def output_type(self) -> TypeInfo: ...
     @property
     def is_async(self) -> bool: ...
+    @property
+    def positional_parameters(self) -> tuple[str, ...] | None: ...
     def __hash__(self): ...
 
 class Solver:
@@ -1,6 +1,7 @@
 """Module containing errors classes."""
 
 from collections.abc import Iterable, Sequence
+from itertools import chain
 from typing import TypeAlias
 
 from composify.core import Solution, TypeInfo
@@ -33,8 +34,12 @@ def _format_trace(trace: Trace) -> str:
 
 
 def _format_traces(traces: Traces) -> str:
-    steps = [str(traces[0][1]), *(_format_trace(trace) for trace in traces[1:])]
-    return " -> ".join(steps)
+    return " -> ".join(
+        chain(
+            (str(traces[0][1]),),
+            (_format_trace(trace) for trace in traces[1:]),
+        )
+    )
 
 
 class SolvingError(Exception):
@@ -47,15 +52,18 @@ class SolveFailureError(SolvingError):
     """Raised when no solutions are found."""
 
     def __init__(self, errors: Iterable[SolvingError]) -> None:
-        error_strings = tuple(
+        # Materialize first so a generator is not exhausted by formatting.
+        self.errors = tuple(errors)
+        error_string = "\n".join(
             f"- {_format_traces(error.traces)}: {error}"
             if isinstance(error, TracedSolvingError)
             else f"- {error}"
-            for error in errors
+            for error in self.errors
         )
-        error_string = "\n".join(error_strings)
         super().__init__(f"Solving failure:\n{error_string}")
-        self.errors = errors
+        self._types: frozenset[type] = frozenset(
+            cls for error in self.errors for cls in type(error).__mro__
+        )
 
     def contains(self, exc_type: type[SolvingError]) -> bool:
         """Checks if any exception raised was of a specific type.
@@ -66,10 +74,7 @@ class SolveFailureError(SolvingError):
         Returns:
             bool: True if an exception of type exc_type exists; otherwise False.
         """
-        for error in self.errors:
-            if isinstance(error, exc_type):
-                return True
-        return False
+        return exc_type in self._types
 
 
 class TracedSolvingError(SolvingError):
@@ -16,9 +16,10 @@ Example:
 
 import asyncio
 import inspect
+import weakref
 from collections.abc import Callable, Iterable, Mapping
 from functools import partial, wraps
-from types import FrameType, ModuleType
+from types import FrameType, GenericAlias, ModuleType
 from typing import Annotated, Any, ParamSpec, TypeVar, get_type_hints
 
 from composify.core import Rule
@@ -58,21 +59,90 @@ class ConstructRuleSet(tuple[Rule, ...]):
     pass
 
 
-def _add_qualifiers(type_: Any, qualifiers: Iterable[Qualifier] | None) -> Any:
-    if qualifiers is not None:
-        for qualifier in qualifiers:
-            type_ = Annotated[type_, qualifier]
-    return type_
+def _add_qualifiers(type_: Any, qualifiers: tuple[Qualifier, ...]) -> Any:
+    # A single subscription avoids an intermediate alias per qualifier.
+    return Annotated[(type_, *qualifiers)]
 
 
-def _get_init_func(cls: type):
+def _get_init_func(cls: type) -> Callable:
     if cls.__init__ == object.__init__:  # type: ignore[misc]
-        func = cls
-        func_params = []
+        return cls
+    return cls.__init__  # type: ignore[misc]
+
+
+def _get_type_hints(func: Callable) -> dict[str, Any]:
+    annotations = getattr(func, "__annotations__", None)
+    if (
+        inspect.isfunction(func)
+        and annotations is not None
+        and all(
+            isinstance(a, type) and not isinstance(a, GenericAlias)
+            for a in annotations.values()
+        )
+    ):
+        # Plain classes need no evaluation of forward references.
+        return dict(annotations)
+    return get_type_hints(func, include_extras=True)
+
+
+_POSITIONAL_KINDS = (
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+)
+
+
+class _Signature:
+    """Parsed signature of a rule function. Type hints are resolved lazily.
+    Holds no reference to the function so caching it does not keep the
+    function alive.
+    """
+
+    __slots__ = ("func_params", "positional_parameters", "_type_hints")
+
+    def __init__(self, parameters: list[inspect.Parameter]) -> None:
+        self.func_params = [p.name for p in parameters]
+        # Builders call positionally only when the solution arguments have
+        # exactly these names in this order.
+        self.positional_parameters = (
+            tuple(self.func_params)
+            if all(p.kind in _POSITIONAL_KINDS for p in parameters)
+            else None
+        )
+        self._type_hints: dict[str, Any] | None = None
+
+    def type_hints(self, func: Callable) -> dict[str, Any]:
+        if self._type_hints is None:
+            self._type_hints = _get_type_hints(func)
+        return self._type_hints
+
+
+_SIGNATURE_CACHE: dict[int, _Signature] = {}
+
+
+def _parse_signature(decorated: Callable) -> tuple[Callable, _Signature]:
+    """Returns the rule function of a decorated object and its signature.
+    Signatures are cached per decorated object until it is garbage collected.
+    """
+    is_class = inspect.isclass(decorated)
+    func = _get_init_func(decorated) if is_class else decorated
+    key = id(decorated)
+    cached = _SIGNATURE_CACHE.get(key, None)
+    if cached is not None:
+        return func, cached
+    if func is not decorated:
+        parameters = list(inspect.signature(func).parameters.values())[1:]
+    elif is_class:
+        parameters = []
     else:
-        func = cls.__init__  # type: ignore[misc]
-        func_params = list(inspect.signature(func).parameters)[1:]
-    return func, func_params
+        parameters = list(inspect.signature(func).parameters.values())
+    cached = _Signature(parameters)
+    try:
+        weakref.finalize(decorated, _SIGNATURE_CACHE.pop, key, None)
+    except TypeError:
+        # Not weak referenceable; we cannot tell when the id is reused.
+        return func, cached
+    _SIGNATURE_CACHE[key] = cached
+    return func, cached
 
 
 def attach_rule(value: Any, rule: Rule | ConstructRuleSet) -> None:
@@ -98,16 +168,13 @@ def _rule_decorator(
     metadata: Iterable[Qualifier] | None = None,
     return_type: type | None = None,
 ) -> Any:
-    if inspect.isclass(decorated):
-        func, func_params = _get_init_func(decorated)
-    else:
-        func = decorated
-        func_params = list(inspect.signature(func).parameters)
+    func, signature = _parse_signature(decorated)
     name = name or f"{func.__module__}:{func.__name__}"
     func_id = f"@rule {name}"
-    type_hints = get_type_hints(func, include_extras=True)
     return_type = return_type or (
-        decorated if inspect.isclass(decorated) else type_hints.get("return")
+        decorated
+        if inspect.isclass(decorated)
+        else signature.type_hints(func).get("return")
     )
     return_type_info = ensure_type_annotation(
         type_annotation=return_type,
@@ -115,17 +182,20 @@ def _rule_decorator(
         raise_type=MissingReturnTypeAnnotation,
     )
 
-    parameter_types: Mapping[str, Any] = {
-        parameter: _add_qualifiers(
-            ensure_type_annotation(
-                type_annotation=type_hints.get(parameter),
-                name=f"{func_id} parameter {parameter}",
-                raise_type=MissingParameterTypeAnnotation,
-            ),
-            metadata,
+    parameter_types: dict[str, Any] = {
+        parameter: ensure_type_annotation(
+            type_annotation=signature.type_hints(func).get(parameter),
+            name=f"{func_id} parameter {parameter}",
+            raise_type=MissingParameterTypeAnnotation,
         )
-        for parameter in func_params
+        for parameter in signature.func_params
     }
+    qualifiers = tuple(metadata) if metadata is not None else ()
+    if qualifiers:
+        parameter_types = {
+            parameter: _add_qualifiers(type_, qualifiers)
+            for parameter, type_ in parameter_types.items()
+        }
     effective_name = resolve_type_name(decorated)
 
     rule = Rule(
@@ -135,11 +205,21 @@ def _rule_decorator(
         dependencies=parameter_types,
         priority=priority,
         is_async=asyncio.iscoroutinefunction(func),
+        positional_parameters=signature.positional_parameters,
     )
     attach_rule(decorated, rule)
     return decorated
 
 
+_DEFAULT_RULE = partial(
+    _rule_decorator,
+    priority=0,
+    name=None,
+    metadata=None,
+    return_type=None,
+)
+
+
 def rule(
     f: Callable | None = None,
     /,
@@ -169,6 +249,13 @@ def rule(
 
     """
     if f is None:
+        if (
+            priority == 0
+            and name is None
+            and metadata is None
+            and return_type is None
+        ):
+            return _DEFAULT_RULE
         return partial(
             _rule_decorator,
             priority=priority,
@@ -243,17 +330,19 @@ def as_rule(f: Any) -> Rule:
     return r
 
 
-def _extract_rules(rule: Any):
-    if isinstance(rule, Rule):
-        yield rule
-    elif isinstance(rule, ConstructRuleSet):
-        for r in rule:
-            yield from _extract_rules(r)
-    else:
-        if not callable(rule):
-            return
-        rule = getattr(rule, RULE_ATTR, None)
-        yield from _extract_rules(rule)
+def _extract_rules(root: Any, out: list[Rule]) -> None:
+    stack = [root]
+    while stack:
+        rule = stack.pop()
+        if isinstance(rule, Rule):
+            out.append(rule)
+        elif isinstance(rule, ConstructRuleSet):
+            # Reversed to keep the set's order when popping.
+            stack.extend(reversed(rule))
+        elif callable(rule):
+            attached = getattr(rule, RULE_ATTR, None)
+            if attached is not None:
+                stack.append(attached)
 
 
 def collect_rules(
@@ -276,14 +365,14 @@ def collect_rules(
         global_items = caller_frame.f_globals
         namespaces = (global_items,)
 
-    def iter_rules():
-        for namespace in namespaces:
-            mapping = (
-                namespace.__dict__
-                if isinstance(namespace, ModuleType)
-                else namespace
-            )
-            for item in mapping.values():
-                yield from _extract_rules(item)
-
-    return list(iter_rules())
+    rules: list[Rule] = []
+    for namespace in namespaces:
+        mapping = (
+            namespace.__dict__
+            if isinstance(namespace, ModuleType)
+            else namespace
+        )
+        for item in mapping.values():
+            _extract_rules(item, rules)
+
+    return rules
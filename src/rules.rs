@@ -1,5 +1,5 @@
 use pyo3::prelude::*;
-use pyo3::types::{PyMapping, PyString};
+use pyo3::types::{PyMapping, PyString, PyTuple};
 
 use std::fmt::{Display, Write};
 use std::hash::{DefaultHasher, Hash, Hasher};
@@ -166,11 +166,15 @@ pub struct Rule {
     pub priority: i32,
     #[pyo3(get)]
     pub is_async: bool,
+    /// Parameter names in signature order, when every parameter can be
+    /// passed positionally.
+    pub positional_parameters: Option<Arc<Py<PyTuple>>>,
 }
 
 #[pymethods]
 impl Rule {
     #[new]
+    #[pyo3(signature = (function, canonical_name, output_type, dependencies, priority, is_async, positional_parameters=None))]
     pub fn new(
         function: Bound<'_, PyAny>,
         canonical_name: String,
@@ -178,6 +182,7 @@ impl Rule {
         dependencies: Bound<'_, PyAny>,
         priority: i32,
         is_async: bool,
+        positional_parameters: Option<Bound<'_, PyTuple>>,
     ) -> PyResult<Self> {
         Ok(Self {
             function: Arc::new(function.into()),
@@ -190,6 +195,7 @@ impl Rule {
             },
             priority,
             is_async,
+            positional_parameters: positional_parameters.map(|p| Arc::new(p.unbind())),
         })
     }
 
@@ -201,6 +207,13 @@ impl Rule {
     pub fn get_function(&self, py: Python) -> Py<PyAny> {
         self.function.clone_ref(py)
     }
+
+    #[getter(positional_parameters)]
+    pub fn get_positional_parameters(&self, py: Python) -> Option<Py<PyTuple>> {
+        self.positional_parameters
+            .as_ref()
+            .map(|parameters| parameters.clone_ref(py))
+    }
 }
 
 impl Display for Rule {
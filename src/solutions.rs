@@ -3,7 +3,11 @@ use std::{
     hash::{DefaultHasher, Hash, Hasher},
 };
 
-use pyo3::{exceptions::PyIndexError, prelude::*, types::PyMapping};
+use pyo3::{
+    exceptions::PyIndexError,
+    prelude::*,
+    types::{PyMapping, PyTuple},
+};
 
 use crate::{rules::Rule, type_info::TypeInfo};
 
@@ -115,6 +119,10 @@ impl SolutionArgsCollection {
         Ok(self.to_string())
     }
 
+    pub fn __len__(&self) -> usize {
+        self.0.len()
+    }
+
     pub fn __getitem__(&self, i: usize) -> PyResult<SolutionArg> {
         match self.0.get(i) {
             Some(val) => Ok(val.clone()),
@@ -195,6 +203,11 @@ impl Solution {
         self.rule.is_async
     }
 
+    #[getter]
+    pub fn positional_parameters(&self, py: Python) -> Option<Py<PyTuple>> {
+        self.rule.get_positional_parameters(py)
+    }
+
     pub fn __repr__(&self) -> PyResult<String> {
         Ok(format!(
             "Solution(rule={}, arguments={})",
@@ -1,5 +1,6 @@
 use pyo3::prelude::*;
-use pyo3::types::PyType;
+use pyo3::sync::GILOnceCell;
+use pyo3::types::{PyDict, PyType};
 use pyo3::{intern, types::PySequence};
 use std::fmt::Display;
 use std::hash::Hash;
@@ -8,6 +9,14 @@ use std::sync::Arc;
 use crate::metadata::{MetadataSet, Qualifiers, QUALIFY_METHOD_NAME};
 use crate::solve_parameters::{SolveCardinality, SolveParameter, SolveSpecificity};
 
+/// Parsed `Annotated[...]` aliases keyed by the identity of the alias.
+/// The same annotations are parsed again on every rule registration and
+/// every solve. Entries are dropped once their alias is garbage collected,
+/// and aliases whose metadata merely compares equal (e.g. `1` and `True`)
+/// are parsed separately.
+static ANNOTATED_CACHE: GILOnceCell<Py<PyDict>> = GILOnceCell::new();
+static WEAKREF_FINALIZE: GILOnceCell<Py<PyType>> = GILOnceCell::new();
+
 fn parse_metadata(
     metadata: &Bound<'_, PySequence>,
 ) -> PyResult<(MetadataSet, Qualifiers, SolveParameter)> {
@@ -15,15 +24,17 @@ fn parse_metadata(
     let mut attributes = Vec::new();
     let mut qualifiers = Vec::new();
     let mut solve_parameter = SolveParameter::default();
+    // Type checks are cheap; the `qualify` lookup raises and swallows an
+    // AttributeError for every plain attribute, so it is done last.
     for py_element in metadata.try_iter()?.flatten() {
-        if py_element.hasattr(intern!(py, QUALIFY_METHOD_NAME))? {
-            qualifiers.push(py_element);
-        } else if let Ok(c) = py_element.downcast::<SolveCardinality>() {
+        if let Ok(c) = py_element.downcast::<SolveCardinality>() {
             let c = c.get();
             solve_parameter.cardinality = c.clone();
         } else if let Ok(s) = py_element.downcast::<SolveSpecificity>() {
             let s = s.get();
             solve_parameter.specificity = s.clone();
+        } else if py_element.hasattr(intern!(py, QUALIFY_METHOD_NAME))? {
+            qualifiers.push(py_element);
         } else {
             attributes.push(py_element);
         }
@@ -96,16 +107,31 @@ impl TypeInfo {
                 }
             }
         };
-        let metadata = if type_annotation.hasattr(intern!(py, "__metadata__"))? {
-            Some(
-                type_annotation
-                    .getattr(intern!(py, "__metadata__"))?
-                    .downcast_into::<PySequence>()?,
-            )
-        } else {
-            None
-        };
-        TypeInfo::__new__(t, metadata)
+        if !type_annotation.hasattr(intern!(py, "__metadata__"))? {
+            return TypeInfo::__new__(t, None);
+        }
+        let cache = ANNOTATED_CACHE
+            .get_or_init(py, || PyDict::new(py).unbind())
+            .bind(py);
+        let key = type_annotation.as_ptr() as usize;
+        if let Some(cached) = cache.get_item(key)? {
+            return Ok(cached.downcast_into::<TypeInfo>()?.get().clone());
+        }
+        let metadata = type_annotation
+            .getattr(intern!(py, "__metadata__"))?
+            .downcast_into::<PySequence>()?;
+        let type_info = TypeInfo::__new__(t, Some(metadata))?;
+        // Aliases that cannot be weakly referenced are parsed every time,
+        // since their id may be reused once they are collected.
+        let finalize = WEAKREF_FINALIZE.import(py, "weakref", "finalize")?;
+        let pop = cache.getattr(intern!(py, "pop"))?;
+        if finalize
+            .call1((&type_annotation, pop, key, py.None()))
+            .is_ok()
+        {
+            cache.set_item(key, type_info.clone())?;
+        }
+        Ok(type_info)
     }
 
     pub fn __repr__(&self) -> PyResult<String> {
@@ -12,7 +12,7 @@ def _select_bp(bp: Solution, path: tuple[str, ...]) -> Solution:
         return bp
     top, rest = path[0], path[1:]
     return _select_bp(
-        next(iter(filter(lambda x: x[0] == top, bp.args)))[1], rest
+        next(iter(filter(lambda x: x.name == top, bp.args))).solution, rest
     )
 
 
@@ -1,4 +1,6 @@
 import asyncio
+import gc
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 import pytest
@@ -92,3 +94,185 @@ async def test_cached_concurrent_construct():
         assert result.value == expected_result
 
     assert counter.execution == 5
+
+
+@pytest.mark.asyncio_cooperative
+async def test_get_cached():
+    plan = solution(
+        double,
+        param=static(Value(5)),
+    )
+    builder = AsyncBuilder()
+    assert await builder.get_cached(plan) is None
+    await builder.from_solution(plan)
+    assert await builder.get_cached(plan) == Value(10)
+
+
+@pytest.mark.asyncio_cooperative
+async def test_bounded_cache():
+    counter = ExecutionCounter()
+    released = asyncio.Event()
+
+    @rule
+    async def pending_value() -> Value:
+        await released.wait()
+        return Value(1)
+
+    double_ = counter(double)
+    quintuple_ = counter(quintuple)
+    squared_ = counter(squared)
+
+    pending = solution(pending_value)
+    doubled = solution(double_, param=static(Value(5)))
+    quintupled = solution(quintuple_, param=static(Value(5)))
+    squared_plan = solution(squared_, param=static(Value(5)))
+
+    builder = AsyncBuilder(maxsize=4)
+    in_flight = asyncio.ensure_future(builder.from_solution(pending))
+    await asyncio.sleep(0)
+
+    await builder.from_solution(doubled)
+    await builder.from_solution(quintupled)
+    # Refreshes doubled, leaving quintupled as the least recently used.
+    assert await builder.get_cached(doubled) == Value(10)
+    await builder.from_solution(squared_plan)
+
+    assert await builder.get_cached(quintupled) is None
+    assert await builder.get_cached(doubled) == Value(10)
+    assert counter.execution == 3
+
+    # The in-flight build is older than all of them but is never evicted.
+    assert not in_flight.done()
+    released.set()
+    assert await in_flight == Value(1)
+    assert await builder.get_cached(pending) == Value(1)
+
+
+@rule
+async def async_value() -> Value:
+    return Value(3)
+
+
+@pytest.mark.asyncio_cooperative
+async def test_construct_async():
+    plan = solution(
+        double,
+        param=solution(async_value),
+    )
+    builder = AsyncBuilder()
+    result = await builder.from_solution(plan)
+    assert result == Value(6)
+
+
+@pytest.mark.asyncio_cooperative
+async def test_construct_threadpool():
+    plan = solution(
+        double,
+        param=solution(quintuple, param=static(Value(1))),
+    )
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        builder = AsyncBuilder(threadpool_executor=executor)
+        result = await builder.from_solution(plan)
+    assert result == Value(10)
+
+
+@rule
+async def async_double(param: Value) -> Value:
+    return Value(param.value * 2)
+
+
+@rule
+def add(a: Value, b: Value) -> Value:
+    return Value(a.value + b.value)
+
+
+@pytest.mark.asyncio_cooperative
+async def test_construct_sync_under_async():
+    counter = ExecutionCounter()
+    quintuple_ = counter(quintuple)
+
+    subtree = solution(quintuple_, param=static(Value(1)))
+    plan = solution(async_double, param=subtree)
+    builder = AsyncBuilder()
+    assert await builder.from_solution(plan) == Value(10)
+    assert await builder.get_cached(subtree) == Value(5)
+    assert counter.execution == 1
+
+
+@pytest.mark.asyncio_cooperative
+async def test_construct_shared_sync_dependency():
+    counter = ExecutionCounter()
+    add_ = counter(add)
+
+    # Every level depends twice on the one below it, so walking each path
+    # separately would visit the bottom 2**30 times.
+    plan = static(Value(1))
+    for _ in range(30):
+        plan = solution(add_, a=plan, b=plan)
+    plan = solution(async_double, param=plan)
+
+    builder = AsyncBuilder()
+    assert await builder.from_solution(plan) == Value(2**31)
+    assert counter.execution == 30
+
+
+@rule
+def positional_add(a: Value, b: Value, /) -> Value:
+    return Value(a.value + b.value)
+
+
+@pytest.mark.asyncio_cooperative
+async def test_construct_positional_only():
+    plan = solution(
+        positional_add,
+        a=static(Value(5)),
+        b=solution(double, param=static(Value(5))),
+    )
+    builder = AsyncBuilder()
+    assert await builder.from_solution(plan) == Value(15)
+
+
+class BuildFailure(Exception):
+    pass
+
+
+@pytest.mark.asyncio_cooperative
+async def test_construct_failing_dependencies():
+    released = asyncio.Event()
+    unhandled = []
+    loop = asyncio.get_running_loop()
+    previous_handler = loop.get_exception_handler()
+    loop.set_exception_handler(lambda _, context: unhandled.append(context))
+
+    @rule
+    async def fail_fast() -> Value:
+        raise BuildFailure("fast")
+
+    @rule
+    async def fail_slow() -> Value:
+        await asyncio.sleep(0.01)
+        raise BuildFailure("slow")
+
+    @rule
+    async def blocked() -> Value:
+        await released.wait()
+        return Value(1)
+
+    builder = AsyncBuilder()
+
+    # Fails as soon as one dependency fails, without waiting on the rest.
+    plan = solution(add, a=solution(fail_fast), b=solution(blocked))
+    with pytest.raises(BuildFailure):
+        await asyncio.wait_for(builder.from_solution(plan), 1)
+    released.set()
+
+    plan = solution(add, a=solution(fail_fast), b=solution(fail_slow))
+    with pytest.raises(BuildFailure):
+        await builder.from_solution(plan)
+    await asyncio.sleep(0.02)
+
+    # Failures that are never retrieved are reported once collected.
+    del builder, plan
+    gc.collect()
+    loop.set_exception_handler(previous_handler)
+    assert unhandled == []
@@ -80,3 +80,36 @@ def test_registry_qualifier():
     assert hash((r2,)) == hash(
         reg.get_rules(Annotated[str, NameQualifier("test2")])
     )
+
+
+class ProbedAttr:
+    """Counts how often parsing probes it for a qualify method."""
+
+    def __init__(self) -> None:
+        self.probes = 0
+
+    def __getattr__(self, name: str):
+        if name == "qualify":
+            self.probes += 1
+        raise AttributeError(name)
+
+
+def test_type_info_parse_cache():
+    attr = ProbedAttr()
+    alias = Annotated[str, attr]
+    assert TypeInfo.parse(alias) == TypeInfo.parse(alias)
+    assert attr.probes == 1
+
+    # An equal alias that is a different object is parsed again.
+    fresh = alias.copy_with((str,))
+    assert fresh == alias and fresh is not alias
+    assert TypeInfo.parse(fresh) == TypeInfo.parse(alias)
+    assert attr.probes == 2
+
+    # Equal metadata of different types must not share a cache entry.
+    for _ in range(2):
+        one = TypeInfo.parse(Annotated[int, 1])
+        true = TypeInfo.parse(Annotated[int, True])
+        assert one.attributes.get(int) == 1
+        assert one.attributes.get(bool) is None
+        assert true.attributes.get(bool) is True
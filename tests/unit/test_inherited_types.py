@@ -4,26 +4,30 @@ from typing import Annotated
 import pytest
 
 from composify.core import SolveSpecificity
-from composify.errors import NoSolutionError, SolveFailureError
+from composify.errors import NoSolutionError
 from composify.rules import rule
-from tests.utils import create_rule_solver, solution
+from tests.utils import assert_solve_failure, create_rule_solver, solution
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class A:
     value: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class B:
     value: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class C(A):
     value: int
 
 
+_A_EXACT = Annotated[A, SolveSpecificity.Exact]
+_A_SUB = Annotated[A, SolveSpecificity.AllowSubclass]
+
+
 @rule
 def create_a() -> A:
     return A(10)
@@ -34,57 +38,51 @@ def create_c() -> C:
     return C(100)
 
 
-@pytest.mark.asyncio_cooperative
-async def test_subclasses(compare_solutions):
-    resolver = create_rule_solver(create_c)
+@pytest.fixture(scope="module")
+def resolver_c():
+    return create_rule_solver(create_c)
+
 
+@pytest.mark.asyncio_cooperative
+async def test_subclasses(resolver_c, compare_solutions):
     compare_solutions(
-        resolver.solve_for(A),
+        resolver_c.solve_for(A),
         [solution(create_c)],
     )
 
-    with pytest.raises(SolveFailureError) as exc:
-        resolver.solve_for(B)
-    assert exc.value.contains(NoSolutionError)
+    assert_solve_failure(lambda: resolver_c.solve_for(B), NoSolutionError)
 
     compare_solutions(
-        resolver.solve_for(C),
+        resolver_c.solve_for(C),
         [solution(create_c)],
     )
 
 
 @pytest.mark.asyncio_cooperative
-async def test_disallowed_subclasses(compare_solutions):
-    resolver = create_rule_solver(create_c)
-
-    with pytest.raises(SolveFailureError) as exc:
-        resolver.solve_for(Annotated[A, SolveSpecificity.Exact])
-    assert exc.value.contains(NoSolutionError)
+async def test_disallowed_subclasses(resolver_c, compare_solutions):
+    assert_solve_failure(
+        lambda: resolver_c.solve_for(_A_EXACT),
+        NoSolutionError,
+    )
 
-    with pytest.raises(SolveFailureError) as exc:
-        resolver.solve_for(B)
-    assert exc.value.contains(NoSolutionError)
+    assert_solve_failure(lambda: resolver_c.solve_for(B), NoSolutionError)
 
     compare_solutions(
-        resolver.solve_for(C),
+        resolver_c.solve_for(C),
         [solution(create_c)],
     )
 
 
 @pytest.mark.asyncio_cooperative
-async def test_allowed_subclasses(compare_solutions):
-    resolver = create_rule_solver(create_c)
-
+async def test_allowed_subclasses(resolver_c, compare_solutions):
     compare_solutions(
-        resolver.solve_for(Annotated[A, SolveSpecificity.AllowSubclass]),
+        resolver_c.solve_for(_A_SUB),
         [solution(create_c)],
     )
 
-    with pytest.raises(SolveFailureError) as exc:
-        resolver.solve_for(B)
-    assert exc.value.contains(NoSolutionError)
+    assert_solve_failure(lambda: resolver_c.solve_for(B), NoSolutionError)
 
     compare_solutions(
-        resolver.solve_for(C),
+        resolver_c.solve_for(C),
         [solution(create_c)],
     )
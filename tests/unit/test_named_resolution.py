@@ -4,22 +4,26 @@ from typing import Annotated
 import pytest
 
 from composify.core import SolveCardinality
-from composify.errors import NoSolutionError, SolveFailureError
-from composify.rules import collect_rules, rule
-from tests.utils import create_rule_solver, solution
+from composify.errors import NoSolutionError
+from composify.rules import rule
+from tests.utils import assert_solve_failure, create_rule_solver, solution
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class A:
     value: int
 
 
+_A_SPECIAL = Annotated[A, "special"]
+_A_EXHAUSTIVE = Annotated[A, SolveCardinality.Exhaustive]
+
+
 @rule
 def create_a() -> A:
     return A(100)
 
 
-rules_1 = collect_rules()
+rules_1 = (create_a,)
 
 
 @rule
@@ -27,31 +31,38 @@ def create_special() -> Annotated[A, "special"]:
     return A(10)
 
 
-rules_2 = collect_rules()
+rules_2 = (create_a, create_special)
 
 
-@pytest.mark.asyncio_cooperative
-async def test_no_named():
-    solver = create_rule_solver(*rules_1)
+@pytest.fixture(scope="module")
+def solver_named_1():
+    return create_rule_solver(*rules_1)
+
 
-    with pytest.raises(SolveFailureError) as exc:
-        solver.solve_for(Annotated[A, "special"])
-    assert exc.value.contains(NoSolutionError)
+@pytest.fixture(scope="module")
+def solver_named_2():
+    return create_rule_solver(*rules_2)
 
 
 @pytest.mark.asyncio_cooperative
-async def test_multiple_with_named(compare_solutions):
-    solver = create_rule_solver(*rules_2)
+async def test_no_named(solver_named_1):
+    assert_solve_failure(
+        lambda: solver_named_1.solve_for(_A_SPECIAL),
+        NoSolutionError,
+    )
+
 
+@pytest.mark.asyncio_cooperative
+async def test_multiple_with_named(solver_named_2, compare_solutions):
     compare_solutions(
-        solver.solve_for(Annotated[A, "special"]),
+        solver_named_2.solve_for(_A_SPECIAL),
         [
             solution(create_special),
         ],
     )
 
     compare_solutions(
-        solver.solve_for(Annotated[A, SolveCardinality.Exhaustive]),
+        solver_named_2.solve_for(_A_EXHAUSTIVE),
         [
             solution(create_a),
             solution(create_special),
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import wraps
 
 import pytest
 
@@ -78,3 +79,54 @@ def test_dependency_qualifiers():
     for d in _rule.dependencies:
         assert d.typing.solve_parameter.specificity == SolveSpecificity.Exact
         assert d.typing.solve_parameter.specificity == SolveSpecificity.Exact
+
+
+def test_redecorated_rule():
+    def example(param: Param) -> Result:
+        return Result(param.value)
+
+    rule(example)
+    first = as_rule(example)
+    rule(priority=5)(example)
+    second = as_rule(example)
+
+    assert first.priority == 0
+    assert second.priority == 5
+    assert first.dependencies == second.dependencies
+
+
+def test_forward_reference_rule():
+    @rule
+    def example(param: "Param") -> "Result":
+        return Result(param.value)
+
+    _rule = as_rule(example)
+    assert _rule.output_type.inner_type == Result
+    assert list(_rule.dependencies)[0].typing.inner_type == Param
+
+
+def test_collect_copied_rule():
+    @wraps(example_sync_rule)
+    def wrapper(param: Param) -> Result:
+        return example_sync_rule(param)
+
+    assert collect_rules({"wrapper": wrapper}) == [as_rule(example_sync_rule)]
+    assert as_rule(wrapper) == as_rule(example_sync_rule)
+
+
+def test_positional_rule():
+    @rule
+    def ordered(a: Param, b: Param) -> Result:
+        return Result(a.value + b.value)
+
+    @rule
+    def unordered(b: Param, a: Param) -> Result:
+        return Result(a.value + b.value)
+
+    @rule
+    def keyword_only(*, a: Param) -> Result:
+        return Result(a.value)
+
+    assert as_rule(ordered).positional_parameters == ("a", "b")
+    assert as_rule(unordered).positional_parameters == ("b", "a")
+    assert as_rule(keyword_only).positional_parameters is None
@@ -1,3 +1,5 @@
+import copy
+import pickle
 from dataclasses import dataclass
 from typing import Annotated
 
@@ -14,6 +16,7 @@ from composify.errors import (
     NoSolutionError,
     NotExclusiveError,
     SolveFailureError,
+    SolvingError,
 )
 from composify.rules import as_rule, collect_rules, rule
 
@@ -94,3 +97,12 @@ def test_not_exclusive():
     with pytest.raises(SolveFailureError) as exc:
         solver.solve_for(Annotated[A, SolveCardinality.Exclusive])
     assert exc.value.contains(NotExclusiveError)
+
+
+def test_copy_solve_failure():
+    error = SolveFailureError([SolvingError("failed")])
+    for copied in (copy.copy(error), pickle.loads(pickle.dumps(error))):
+        assert str(copied) == str(error)
+        assert [str(e) for e in copied.errors] == ["failed"]
+        assert copied.contains(SolvingError)
+        assert not copied.contains(NoSolutionError)
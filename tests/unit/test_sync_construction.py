@@ -8,7 +8,7 @@ from composify.rules import rule
 from tests.utils import ExecutionCounter, solution, static
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Value:
     value: int
 
@@ -57,12 +57,14 @@ def test_construct_async():
         builder.from_solution(plan)
 
 
-def test_cached_construct():
+@pytest.fixture
+def counted_rules():
     counter = ExecutionCounter()
+    return counter, counter(double), counter(quintuple), counter(squared)
 
-    double_ = counter(double)
-    quintuple_ = counter(quintuple)
-    squared_ = counter(squared)
+
+def test_cached_construct(counted_rules):
+    counter, double_, quintuple_, squared_ = counted_rules
 
     s1 = solution(
         double_,
@@ -75,46 +77,148 @@ def test_cached_construct():
 
     assert s1 == s2
 
-    testcases = {
-        solution(
-            double_,
-            param=static(Value(5)),
-        ): 10,
-        solution(
-            double_,
-            param=static(Value(5)),
-        ): 10,
-        solution(
-            quintuple_,
-            param=solution(
+    plans = (
+        (
+            solution(
                 double_,
                 param=static(Value(5)),
             ),
-        ): 50,
-        solution(
-            double_,
-            param=solution(
-                quintuple_,
+            10,
+        ),
+        (
+            solution(
+                double_,
                 param=static(Value(5)),
             ),
-        ): 50,
-        solution(
-            squared_,
-            param=solution(
+            10,
+        ),
+        (
+            solution(
+                quintuple_,
+                param=solution(
+                    double_,
+                    param=static(Value(5)),
+                ),
+            ),
+            50,
+        ),
+        (
+            solution(
                 double_,
-                param=static(Value(5)),
+                param=solution(
+                    quintuple_,
+                    param=static(Value(5)),
+                ),
             ),
-        ): 100,
-    }
-    assert len(testcases) == 4
+            50,
+        ),
+        (
+            solution(
+                squared_,
+                param=solution(
+                    double_,
+                    param=static(Value(5)),
+                ),
+            ),
+            100,
+        ),
+    )
+    assert len({plan for plan, expected in plans if expected == 10}) == 1
 
     builder = Builder()
 
-    plans, expected_results = zip(*testcases.items())
-
-    results = tuple(builder.from_solution(plan) for plan in plans)
-    for result, expected_result in zip(results, expected_results):
+    for plan, expected_result in plans:
+        result = builder.from_solution(plan)
         assert isinstance(result, Value)
         assert result.value == expected_result
 
     assert counter.execution == 5
+
+
+def test_construct_many(counted_rules):
+    counter, double_, quintuple_, squared_ = counted_rules
+
+    doubled = solution(double_, param=static(Value(5)))
+    plans = (
+        doubled,
+        solution(quintuple_, param=doubled),
+        solution(squared_, param=doubled),
+    )
+
+    builder = Builder()
+    assert builder.from_solutions(plans) == [Value(10), Value(50), Value(100)]
+    assert counter.execution == 3
+
+    assert builder.from_solution(plans[1]) == Value(50)
+    assert counter.execution == 3
+
+
+def test_bounded_cache():
+    counter = ExecutionCounter()
+
+    double_ = counter(double)
+    quintuple_ = counter(quintuple)
+
+    doubled = solution(double_, param=static(Value(5)))
+    quintupled = solution(quintuple_, param=static(Value(5)))
+
+    builder = Builder(maxsize=2)
+    builder.from_solution(doubled)
+    builder.from_solution(quintupled)
+    assert builder.from_solution(doubled) == Value(10)
+
+    assert counter.execution == 3
+
+
+@rule
+def subtract(b: Value, a: Value) -> Value:
+    return Value(b.value - a.value)
+
+
+def test_construct_unordered_parameters():
+    plan = solution(
+        subtract,
+        a=static(Value(5)),
+        b=solution(double, param=static(Value(5))),
+    )
+    builder = Builder()
+    assert builder.from_solution(plan) == Value(5)
+
+
+@rule
+def positional_add(a: Value, b: Value, /) -> Value:
+    return Value(a.value + b.value)
+
+
+def test_construct_positional_only():
+    plan = solution(
+        positional_add,
+        a=static(Value(5)),
+        b=solution(double, param=static(Value(5))),
+    )
+    builder = Builder()
+    assert builder.from_solution(plan) == Value(15)
+
+
+def test_construct_mismatched_arguments():
+    plan = solution(
+        positional_add,
+        a=static(Value(5)),
+        c=static(Value(5)),
+    )
+    builder = Builder()
+    with pytest.raises(TypeError):
+        builder.from_solution(plan)
+
+
+def test_build_shared_dependency():
+    counter = ExecutionCounter()
+
+    double_ = counter(double)
+
+    shared = solution(double_, param=static(Value(5)))
+    plan = solution(subtract, a=shared, b=shared)
+
+    builder = Builder()
+    assert builder.build_all(plan) == Value(0)
+    assert counter.execution == 1
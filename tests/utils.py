@@ -1,50 +1,108 @@
+from collections.abc import Callable
 from typing import Any
 
 from composify.core import RuleRegistry, Solution, Solver
+from composify.errors import SolveFailureError, SolvingError
 from composify.rules import as_rule, static_rule, wraps_rule
 
+__all__ = (
+    "ExecutionCounter",
+    "assert_solve_failure",
+    "create_rule_solver",
+    "find_difference",
+    "solution",
+    "static",
+)
+
 
 def create_rule_solver(*rules) -> Solver:
     reg = RuleRegistry()
-    reg.add_rules(as_rule(rule) for rule in rules)
+    reg.add_rules(tuple(as_rule(rule) for rule in rules))
     return Solver(reg)
 
 
+# Solutions interned by the identity of their inputs. Entries keep those
+# inputs alive, so an id in a key can never be reused by another object.
+_interned: dict[tuple, tuple[Solution, tuple]] = {}
+
+
 def solution(rule: Any, **kwargs: Solution) -> Solution:
-    return Solution(as_rule(rule), kwargs)
+    # Keyed by the attached Rule rather than the function, so decorating a
+    # function again does not return a solution of its previous rule.
+    rule = as_rule(rule)
+    key = (
+        solution,
+        id(rule),
+        tuple(sorted((k, id(v)) for k, v in kwargs.items())),
+    )
+    interned = _interned.get(key, None)
+    if interned is None:
+        # Leaves pass None so no empty mapping has to be inspected.
+        interned = (
+            Solution(rule, kwargs or None),
+            (rule, *kwargs.values()),
+        )
+        _interned[key] = interned
+    return interned[0]
 
 
 def static(value: Any, **kwargs) -> Solution:
-    return Solution(static_rule("__test_static__", value, **kwargs))
+    key = (static, id(value), tuple(sorted(kwargs.items())))
+    interned = _interned.get(key, None)
+    if interned is None:
+        interned = (
+            Solution(static_rule("__test_static__", value, **kwargs)),
+            (value,),
+        )
+        _interned[key] = interned
+    return interned[0]
 
 
 class ExecutionCounter:
     def __init__(self) -> None:
-        self.execution = 0
+        self._count = [0]
+
+    @property
+    def execution(self) -> int:
+        return self._count[0]
 
     def __call__(self, f):
+        count = self._count
+
         @wraps_rule(f)
         def wrapper(*args, **kwargs):
-            self.execution += 1
+            count[0] += 1
             return f(*args, **kwargs)
 
         return wrapper
 
 
-def _find_difference(
-    result: Solution, expected: Solution, path: tuple
-) -> tuple | None:
-    if result.rule != expected.rule:
-        return path
-    r_depends = tuple(result.args)
-    e_depends = tuple(expected.args)
-    if len(r_depends) != len(e_depends):
-        return path
-    for (r_name, r_depend), (e_name, e_depend) in zip(r_depends, e_depends):
-        if r_name != e_name:
+def find_difference(result: Solution, expected: Solution) -> tuple | None:
+    stack: list[tuple[Solution, Solution, tuple]] = [(result, expected, ())]
+    while stack:
+        result, expected, path = stack.pop()
+        if result.rule != expected.rule:
             return path
-        return _find_difference(r_depend, e_depend, path + (r_name,))
+        r_depends = result.args
+        e_depends = expected.args
+        if len(r_depends) != len(e_depends):
+            return path
+        # Pushed in reverse so the first differing argument is reported.
+        for r_depend, e_depend in reversed(tuple(zip(r_depends, e_depends))):
+            if r_depend.name != e_depend.name:
+                return path
+            stack.append(
+                (r_depend.solution, e_depend.solution, path + (r_depend.name,))
+            )
+    return None
 
 
-def find_difference(result: Solution, expected: Solution) -> tuple | None:
-    return _find_difference(result, expected, tuple())
+def assert_solve_failure(
+    fn: Callable[[], Any], inner: type[SolvingError]
+) -> None:
+    try:
+        fn()
+    except SolveFailureError as exc:
+        assert exc.contains(inner), f"{inner.__name__} not raised: {exc}"
+    else:
+        raise AssertionError("SolveFailureError not raised")